@@ -25,6 +25,8 @@ class Error:
 
     """
 
+    __slots__ = ("code", "args", "nested_errors", "_message")
+
     def __init__(
         self,
         code: str,
@@ -53,13 +55,9 @@ class Error:
         :class:`~goodboy.i18n.Translations` instance.
         """
 
-        format_kwargs = self.args
-
-        for key, value in format_kwargs.items():
-            if isinstance(value, Message):
-                format_kwargs[key] = value.render(format, {}, translations)
-
-        return self._message.render(format, format_kwargs, translations)
+        # Message arguments are rendered by Message.render itself, so error args are
+        # left untouched and the same error can be rendered in different formats
+        return self._message.render(format, self.args, translations)
 
     @property
     def message(self) -> str:
@@ -93,6 +91,9 @@ class Error:
         return f"Error({arguments_repr})"
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if isinstance(other, self.__class__):
             return (
                 self.code == other.code
@@ -104,6 +105,10 @@ class Error:
         return super().__eq__(other)
 
 
+# Argument types, that are passed to JSON as is
+_JSON_SCALAR_TYPES = (str, int, float)
+
+
 class ErrorFormatter(ABC):
     @abstractmethod
     def format(self, errors: list[Error]) -> Any:
@@ -121,44 +126,30 @@ class JSONErrorFormatter(I18nErrorFormatter):
         super().__init__(translations)
 
     def format(self, errors: list[Error]) -> list[dict[str, Any]]:
-        result = []
-
-        for error in errors:
-            result.append(self._format_error(error))
-
-        return result
+        return [self._format_error(error) for error in errors]
 
     def _format_error(self, error: Error) -> dict[str, Any]:
-        args: dict[str, Any] = {}
-
-        for arg_key, arg_value in error.args.items():
-            args[arg_key] = self._format_argument_value(arg_value)
-
-        # formatted_nested_errors: Union[dict[str, Any], dict[int, Any]] = {}
-        formatted_nested_errors: dict[Union[str, int], list[dict[str, Any]]] = {}
-
-        for nested_key, nested_errors in error.nested_errors.items():
-            formatted_nested_errors[nested_key] = self.format(nested_errors)
-
         result: dict[str, Any] = {
             "code": error.code,
             "message": error.get_message("json", self._translations),
         }
 
-        if args:
-            result["args"] = args
+        if error.args:
+            result["args"] = {
+                arg_key: self._format_argument_value(arg_value)
+                for arg_key, arg_value in error.args.items()
+            }
 
-        if formatted_nested_errors:
-            result["nested_errors"] = formatted_nested_errors
+        if error.nested_errors:
+            result["nested_errors"] = {
+                nested_key: self.format(nested_errors)
+                for nested_key, nested_errors in error.nested_errors.items()
+            }
 
         return result
 
     def _format_argument_value(self, value: Any) -> Any:
-        if isinstance(value, str):
-            return value
-        elif isinstance(value, int):
-            return value
-        elif isinstance(value, float):
+        if isinstance(value, _JSON_SCALAR_TYPES):
             return value
         elif isinstance(value, Message):
             return value.render("json", translations=self._translations)
@@ -185,7 +176,11 @@ class TextErrorFormatter(I18nErrorFormatter):
             message = error.get_message(translations=self._translations)
 
             if error.args:
-                args = " " + repr(error.args)
+                formatted_args = {
+                    arg_key: self._format_argument_value(arg_value)
+                    for arg_key, arg_value in error.args.items()
+                }
+                args = " " + repr(formatted_args)
             else:
                 args = ""
 
@@ -198,6 +193,14 @@ class TextErrorFormatter(I18nErrorFormatter):
 
         return lines
 
+    def _format_argument_value(self, value: Any) -> Any:
+        if isinstance(value, Message):
+            return value.render(translations=self._translations)
+        elif isinstance(value, list):
+            return [self._format_argument_value(v) for v in value]
+        else:
+            return value
+
     def _indent(self, level: int) -> str:
         return "    " * level
 
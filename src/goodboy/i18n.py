@@ -80,6 +80,8 @@ class I18nLazyString:
     :class:`~goodboy.messages.Message` render.
     """
 
+    __slots__ = ("_message",)
+
     def __init__(self, message: str):
         self._message = message
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 
 from goodboy.i18n import I18nLazyString, Translations, get_current_translations
@@ -55,6 +56,8 @@ class Message:
     TODO: Link i18n documentation.
     """
 
+    __slots__ = ("_formats", "_default_text")
+
     def __init__(
         self,
         default: str | I18nLazyString,
@@ -62,6 +65,15 @@ class Message:
     ) -> None:
         self._formats = {"default": default, **other_formats}
 
+        # Plain default pattern without placeholders renders to itself, so it can be
+        # returned as is when no format arguments are passed
+        self._default_text: Optional[str]
+
+        if isinstance(default, str) and "{" not in default and "}" not in default:
+            self._default_text = default
+        else:
+            self._default_text = None
+
     def render(
         self,
         format: Optional[str] = None,
@@ -83,6 +95,13 @@ class Message:
         TODO: Link i18n documentation.
         """
 
+        if (
+            self._default_text is not None
+            and not kwargs
+            and (format == "default" or format not in self._formats)
+        ):
+            return self._default_text
+
         if format in self._formats:
             pattern = self._formats[format]
         else:
@@ -122,6 +141,16 @@ class Message:
         return f"Message({arguments_repr})"
 
 
+@lru_cache(maxsize=1024)
+def _default_message(code: str) -> Message:
+    """
+    Message used for error codes without specified message. Cached, since the same
+    unknown code is usually requested many times.
+    """
+
+    return Message(code)
+
+
 class MessageCollection:
     def __init__(
         self,
@@ -147,7 +176,7 @@ class MessageCollection:
         try:
             return self[code]
         except KeyError:
-            return Message(code)
+            return _default_message(code)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
@@ -229,5 +258,6 @@ _TYPE_NAMES_LIST: list[Message] = [
 _TYPE_NAMES = MessageCollection({m.render(): m for m in _TYPE_NAMES_LIST})
 
 
+@lru_cache(maxsize=None)
 def type_name(python_type_name: str) -> Message:
     return _TYPE_NAMES[python_type_name]
@@ -36,11 +36,14 @@ Rule = Callable[["SchemaRulesMixin", Any, bool, dict], Tuple[Any, List[Error]]]
 
 
 class SchemaRulesMixin:
-    _rules: list[Rule]
+    _rules: tuple[Rule, ...]
 
     def _call_rules(
         self, value: Any, typecast: bool = False, context: dict[str, Any] = {}
     ) -> tuple[Any, list[Error]]:
+        if not self._rules:
+            return value, []
+
         result_errors = []
 
         for rule in self._rules:
@@ -65,7 +68,7 @@ class SchemaWithUtils(Schema, SchemaErrorMixin, SchemaRulesMixin):
         else:
             self._messages = MessageCollection(messages, parent=DEFAULT_MESSAGES)
 
-        self._rules = rules
+        self._rules = tuple(rules)
 
     def __call__(
         self, value: Any, *, typecast: bool = False, context: dict[str, Any] = {}
@@ -89,6 +92,21 @@ class SchemaWithUtils(Schema, SchemaErrorMixin, SchemaRulesMixin):
 
         return value
 
+    def is_valid(
+        self, value: Any, *, typecast: bool = False, context: dict[str, Any] = {}
+    ) -> bool:
+        """
+        Check if value is valid. Same as calling schema, but returns result instead
+        of raising :class:`SchemaError`.
+        """
+
+        try:
+            self(value, typecast=typecast, context=context)
+        except SchemaError:
+            return False
+
+        return True
+
     @abstractmethod
     def _validate(
         self, value: Any, typecast: bool, context: dict[str, Any] = {}
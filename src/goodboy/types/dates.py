@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Generic, Optional, TypeVar, Union
 
 from goodboy.errors import Error
@@ -10,6 +11,141 @@ from goodboy.schema import Rule, SchemaWithUtils
 
 D = TypeVar("D")
 
+# strptime directives, that are parsed by _FormatParser as fixed-width numbers
+_FIXED_WIDTH_DIRECTIVES: dict[str, tuple[str, int]] = {
+    "Y": ("year", 4),
+    "m": ("month", 2),
+    "d": ("day", 2),
+    "H": ("hour", 2),
+    "M": ("minute", 2),
+    "S": ("second", 2),
+}
+
+
+class _FormatParser:
+    """
+    Precompiled parser for strptime formats, that contain only fixed-width numeric
+    directives (``%Y``, ``%m``, ``%d``, ``%H``, ``%M``, ``%S``) and literal text,
+    like ``%Y-%m-%d %H:%M:%S``.
+
+    Format is tokenized once, so parsing is reduced to string slicing and ``int``
+    calls. Parser is a fast path only: it returns ``None`` for any input it cannot
+    parse, and ``datetime.strptime`` should be used then, since it also accepts
+    non-padded numbers, extra whitespace and so on.
+
+    Use :func:`_compile_format` to create parser instead of direct instantiation.
+    """
+
+    def __init__(
+        self,
+        format: str,
+        fields: list[tuple[str, int, int]],
+        literals: list[tuple[int, str]],
+        length: int,
+    ) -> None:
+        self._format = format
+        self._fields = fields
+        self._literals = literals
+        self._length = length
+
+    def parse(self, input: str) -> Optional[datetime]:
+        if len(input) != self._length:
+            return None
+
+        for position, literal in self._literals:
+            if not input.startswith(literal, position):
+                return None
+
+        values = {"year": 1900, "month": 1, "day": 1}
+
+        for name, start, end in self._fields:
+            number = input[start:end]
+
+            if not (number.isascii() and number.isdigit()):
+                return None
+
+            values[name] = int(number)
+
+        try:
+            return datetime(
+                values["year"],
+                values["month"],
+                values["day"],
+                values.get("hour", 0),
+                values.get("minute", 0),
+                values.get("second", 0),
+            )
+        except ValueError:
+            return None
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, self.__class__):
+            return self._format == other._format
+
+        return super().__eq__(other)
+
+
+@lru_cache(maxsize=128)
+def _compile_format(format: str) -> Optional[_FormatParser]:
+    """
+    Compile strptime format to :class:`_FormatParser`. Returns ``None`` if format
+    contains directives, that are not supported by parser.
+
+    Compiled parsers are cached by format and shared between schemas, since parser
+    has no mutable state.
+    """
+
+    fields: list[tuple[str, int, int]] = []
+    literals: list[tuple[int, str]] = []
+    field_names: set[str] = set()
+    position = 0
+    literal = ""
+    index = 0
+
+    while index < len(format):
+        char = format[index]
+
+        if char != "%":
+            literal += char
+            index += 1
+            continue
+
+        # strptime rejects trailing "%"
+        if index + 1 == len(format):
+            return None
+
+        directive = format[index + 1]
+
+        if directive == "%":
+            literal += "%"
+            index += 2
+            continue
+
+        if directive not in _FIXED_WIDTH_DIRECTIVES:
+            return None
+
+        name, width = _FIXED_WIDTH_DIRECTIVES[directive]
+
+        # strptime rejects formats with repeated directives
+        if name in field_names:
+            return None
+
+        if literal:
+            literals.append((position, literal))
+            position += len(literal)
+            literal = ""
+
+        fields.append((name, position, position + width))
+        field_names.add(name)
+        position += width
+        index += 2
+
+    if literal:
+        literals.append((position, literal))
+        position += len(literal)
+
+    return _FormatParser(format, fields, literals, position)
+
 
 class DateBase(Generic[D], SchemaWithUtils):
     """
@@ -36,13 +172,17 @@ class DateBase(Generic[D], SchemaWithUtils):
         self._later_than = self._typecast_optional_option(later_than)
         self._later_or_equal_to = self._typecast_optional_option(later_or_equal_to)
         self._format = format
+        self._format_parser = _compile_format(format) if format else None
 
         self._allowed: Optional[list[D]]
+        self._allowed_set: Optional[frozenset[D]]
 
         if allowed is not None:
             self._allowed = list(map(self._typecast_option, allowed))
+            self._allowed_set = frozenset(self._allowed)
         else:
             self._allowed = None
+            self._allowed_set = None
 
     def _validate(
         self, value: Any, typecast: bool, context: dict[str, Any] = {}
@@ -54,7 +194,7 @@ class DateBase(Generic[D], SchemaWithUtils):
 
         errors = []
 
-        if self._allowed is not None and value not in self._allowed:
+        if self._allowed_set is not None and value not in self._allowed_set:
             errors.append(self._error("not_allowed", {"allowed": self._allowed}))
 
         if self._earlier_than and value >= self._earlier_than:
@@ -81,6 +221,20 @@ class DateBase(Generic[D], SchemaWithUtils):
 
         return value, errors + rule_errors
 
+    def _strptime(self, input: str, format: str) -> datetime:
+        if format == self._format:
+            parser = self._format_parser
+        else:
+            parser = _compile_format(format)
+
+        if parser is not None:
+            value = parser.parse(input)
+
+            if value is not None:
+                return value
+
+        return datetime.strptime(input, format)
+
     def _typecast_optional_option(self, input: Union[D, str, None]) -> Optional[D]:
         if input is None:
             return None
@@ -138,7 +292,7 @@ class Date(DateBase[date]):
                 format = None
 
             if format:
-                return datetime.strptime(input, format).date(), []
+                return self._strptime(input, format).date(), []
             else:
                 return date.fromisoformat(input), []
 
@@ -202,7 +356,7 @@ class DateTime(DateBase[datetime]):
                 format = None
 
             if format:
-                return datetime.strptime(input, format), []
+                return self._strptime(input, format), []
             else:
                 return datetime.fromisoformat(input), []
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 from enum import Enum
 from typing import Any, Callable, Mapping, Optional, Tuple, Union
 
@@ -10,6 +11,9 @@ from goodboy.types.simple import Str
 
 KeyPredicateFunction = Callable[[Mapping[str, Any]], bool]
 
+# Sentinel for absent dict keys, None is a valid key value
+_MISSING = object()
+
 
 class KeyPredicateBinaryOp(str, Enum):
     EQ = "=="
@@ -28,6 +32,54 @@ KeyPredicateExpr = Tuple[KeyPredicateOperand, KeyPredicateBinaryOp, KeyPredicate
 
 KeyPredicate = Union[KeyPredicateFunction, KeyPredicateExpr]
 
+_PREDICATE_OPERATORS: dict[KeyPredicateBinaryOp, Callable[[Any, Any], Any]] = {
+    KeyPredicateBinaryOp.EQ: operator.eq,
+    KeyPredicateBinaryOp.NE: operator.ne,
+    KeyPredicateBinaryOp.LT: operator.lt,
+    KeyPredicateBinaryOp.LTE: operator.le,
+    KeyPredicateBinaryOp.GT: operator.gt,
+    KeyPredicateBinaryOp.GTE: operator.ge,
+    KeyPredicateBinaryOp.AND: lambda left, right: left and right,
+    KeyPredicateBinaryOp.OR: lambda left, right: left or right,
+}
+
+
+def _compile_predicate(
+    predicate: Optional[KeyPredicate],
+) -> Optional[KeyPredicateFunction]:
+    if predicate is None or callable(predicate):
+        return predicate
+    elif isinstance(predicate, tuple):
+        return _compile_predicate_expression(predicate)
+    else:
+        raise TypeError("invalid key predicate type")
+
+
+def _compile_predicate_expression(predicate: KeyPredicateExpr) -> KeyPredicateFunction:
+    left, op, right = predicate
+
+    try:
+        op_function = _PREDICATE_OPERATORS[KeyPredicateBinaryOp(op)]
+    except ValueError:
+        raise ValueError("unknown predicate expression operator") from None
+
+    left_value = _compile_predicate_operand(left)
+    right_value = _compile_predicate_operand(right)
+
+    return lambda prev_values: op_function(
+        left_value(prev_values), right_value(prev_values)
+    )
+
+
+def _compile_predicate_operand(
+    operand: KeyPredicateOperand,
+) -> Callable[[Mapping[str, Any]], Any]:
+    if isinstance(operand, str) and operand.startswith("$"):
+        name = operand[1:]
+        return lambda prev_values: prev_values.get(name)
+    else:
+        return lambda prev_values: operand
+
 
 class Key:
     """
@@ -40,6 +92,15 @@ class Key:
     :param predicate: Key is allowed only if predicate returns true.
     """
 
+    __slots__ = (
+        "name",
+        "required",
+        "default",
+        "_schema",
+        "_predicate",
+        "_predicate_function",
+    )
+
     def __init__(
         self,
         name: str,
@@ -57,51 +118,13 @@ class Key:
         self.default = default
         self._schema = schema
         self._predicate = predicate
+        self._predicate_function = _compile_predicate(predicate)
 
     def predicate_result(self, prev_values: Mapping[str, Any]) -> bool:
-        if self._predicate is None:
+        if self._predicate_function is None:
             return True
 
-        if callable(self._predicate):
-            return self._predicate(prev_values)
-        elif isinstance(self._predicate, tuple):
-            return self._predicate_expression_result(self._predicate, prev_values)
-        else:
-            raise TypeError("invalid key predicate type")
-
-    def _predicate_expression_result(
-        self, predicate: KeyPredicateExpr, prev_values: Mapping[str, Any]
-    ) -> bool:
-        left, op, right = predicate
-
-        if isinstance(left, str) and left.startswith("$"):
-            left_value = prev_values.get(left[1:])
-        else:
-            left_value = left
-
-        if isinstance(right, str) and right.startswith("$"):
-            right_value = prev_values.get(right[1:])
-        else:
-            right_value = right
-
-        if op == KeyPredicateBinaryOp.EQ:
-            return left_value == right_value
-        elif op == KeyPredicateBinaryOp.NE:
-            return left_value != right_value
-        elif op == KeyPredicateBinaryOp.LT:
-            return left_value < right_value
-        elif op == KeyPredicateBinaryOp.LTE:
-            return left_value <= right_value
-        elif op == KeyPredicateBinaryOp.GT:
-            return left_value > right_value
-        elif op == KeyPredicateBinaryOp.GTE:
-            return left_value >= right_value
-        elif op == KeyPredicateBinaryOp.AND:
-            return left_value and right_value
-        elif op == KeyPredicateBinaryOp.OR:
-            return left_value or right_value
-        else:
-            raise ValueError("unknown predicate expression operator")
+        return self._predicate_function(prev_values)
 
     def validate(self, value: Any, typecast: bool, context: dict[str, Any]) -> Any:
         if self._schema:
@@ -114,7 +137,14 @@ class Key:
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            # compiled predicate function is derived from predicate, skip it
+            return (
+                self.name == other.name
+                and self.required == other.required
+                and self.default == other.default
+                and self._schema == other._schema
+                and self._predicate == other._predicate
+            )
 
         return super().__eq__(other)
 
@@ -126,7 +156,8 @@ class Dict(SchemaWithUtils):
 
     :param allow_none: If true, value is allowed to be ``None``.
     :param messages: Override error messages.
-    :param rules: Custom validation rules.
+    :param rules: Custom validation rules. Rules receive a new dict built by schema,
+        not the input value, so they may modify it in place.
     :param keys: List of allowed keys
     :param key_schema: Schema to validate dict keys (only Str is supported)
     :param value_schema: Schema to validate dict key values
@@ -162,6 +193,14 @@ class Dict(SchemaWithUtils):
                 self._error("unexpected_type", {"expected_type": type_name("dict")})
             ]
 
+        if (
+            self._keys is None
+            and self._key_schema is None
+            and self._value_schema is None
+            and not self._rules
+        ):
+            return value.copy(), []
+
         if self._keys is not None:
             (
                 result_value,
@@ -245,17 +284,19 @@ class Dict(SchemaWithUtils):
         result_key_errors: dict[Union[str, int], list[Error]] = {}
         result_value_errors: dict[Union[str, int], list[Error]] = {}
 
-        unknown_keys = list(value.keys())
+        # Not yet consumed input values. Dict preserves input key order, and pop()
+        # takes the value out with a single lookup
+        unknown_keys = value.copy()
 
         for key in self._keys:
             if not key.predicate_result(result_value):
                 continue
 
-            if key.name in unknown_keys:
-                unknown_keys.remove(key.name)
+            input_value = unknown_keys.pop(key.name, _MISSING)
 
+            if input_value is not _MISSING:
                 try:
-                    key_value = key.validate(value[key.name], typecast, context)
+                    key_value = key.validate(input_value, typecast, context)
                 except SchemaError as e:
                     result_value_errors[key.name] = e.errors
                 else:
@@ -274,7 +315,12 @@ class Dict(SchemaWithUtils):
                 if key_required:
                     result_key_errors[key.name] = [self._error("required_key")]
 
-        return result_value, result_key_errors, result_value_errors, unknown_keys
+        return (
+            result_value,
+            result_key_errors,
+            result_value_errors,
+            list(unknown_keys),
+        )
 
     def _validate_keys_by_schema(
         self,
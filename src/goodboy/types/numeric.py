@@ -35,6 +35,20 @@ class NumericBase(Generic[N], SchemaWithUtils):
         self._greater_than = greater_than
         self._greater_or_equal_to = greater_or_equal_to
         self._allowed = allowed
+        self._allowed_set: Optional[frozenset[N]]
+
+        try:
+            self._allowed_set = frozenset(allowed) if allowed is not None else None
+        except TypeError:
+            self._allowed_set = None
+
+        self._has_constraints = (
+            allowed is not None
+            or less_than is not None
+            or less_or_equal_to is not None
+            or greater_than is not None
+            or greater_or_equal_to is not None
+        )
 
     def _validate(
         self, value: Any, typecast: bool, context: dict[str, Any] = {}
@@ -44,9 +58,12 @@ class NumericBase(Generic[N], SchemaWithUtils):
         if type_errors:
             return None, type_errors
 
+        if not self._has_constraints:
+            return self._call_rules(value, typecast, context)
+
         errors = []
 
-        if self._allowed is not None and value not in self._allowed:
+        if self._allowed is not None and not self._is_allowed(value):
             errors.append(self._error("not_allowed", {"allowed": self._allowed}))
 
         if self._less_than is not None and value >= self._less_than:
@@ -73,6 +90,19 @@ class NumericBase(Generic[N], SchemaWithUtils):
 
         return value, errors + rule_errors
 
+    def _is_allowed(self, value: N) -> bool:
+        assert self._allowed is not None
+
+        # signaling Decimal NaN is not hashable, so allowed list is searched when set
+        # is not built or value cannot be looked up in it
+        if self._allowed_set is not None:
+            try:
+                return value in self._allowed_set
+            except TypeError:
+                pass
+
+        return value in self._allowed
+
     @abstractmethod
     def _validate_exact_type(self, value: Any) -> tuple[Optional[N], list[Error]]:
         ...
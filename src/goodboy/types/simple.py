@@ -128,6 +128,21 @@ class Str(SchemaWithUtils):
 
         self._is_regex = is_regex
         self._allowed = allowed
+        self._allowed_set: Optional[frozenset[str]]
+
+        try:
+            self._allowed_set = frozenset(allowed) if allowed is not None else None
+        except TypeError:
+            self._allowed_set = None
+
+        self._has_constraints = (
+            allowed is not None
+            or min_length is not None
+            or max_length is not None
+            or length is not None
+            or self._pattern is not None
+            or is_regex
+        )
 
     def _validate(
         self, value: Any, typecast: bool, context: dict[str, Any] = {}
@@ -143,18 +158,23 @@ class Str(SchemaWithUtils):
             else:
                 return None, [self._error("cannot_be_blank")]
 
+        if not self._has_constraints:
+            return self._call_rules(value, typecast, context)
+
         errors = []
 
-        if self._allowed is not None and value not in self._allowed:
+        if self._allowed is not None and not self._is_allowed(value):
             errors.append(self._error("not_allowed", {"allowed": self._allowed}))
 
-        if self._min_length is not None and len(value) < self._min_length:
+        value_length = len(value)
+
+        if self._min_length is not None and value_length < self._min_length:
             errors.append(self._error("string_too_short", {"value": self._min_length}))
 
-        if self._max_length is not None and len(value) > self._max_length:
+        if self._max_length is not None and value_length > self._max_length:
             errors.append(self._error("string_too_long", {"value": self._max_length}))
 
-        if self._length is not None and len(value) != self._length:
+        if self._length is not None and value_length != self._length:
             errors.append(self._error("invalid_string_length", {"value": self._length}))
 
         if self._pattern and not self._pattern.match(value):
@@ -170,6 +190,15 @@ class Str(SchemaWithUtils):
 
         return value, errors + rule_errors
 
+    def _is_allowed(self, value: str) -> bool:
+        assert self._allowed is not None
+
+        # set is not built when some of allowed values are not hashable
+        if self._allowed_set is None:
+            return value in self._allowed
+
+        return value in self._allowed_set
+
     def _typecast(
         self, input: Any, context: dict[str, Any] = {}
     ) -> tuple[Optional[str], list[Error]]:
@@ -11,10 +11,7 @@ from goodboy.schema import SchemaError
 
 class TranslationsMock:
     def __init__(self, translations):
-        self._translations = translations
-
-    def gettext(self, message):
-        return self._translations[message]
+        self.gettext = translations.__getitem__
 
 
 @contextmanager
@@ -25,30 +22,43 @@ def assert_declarative_errors(value_errors: dict[str, list[Error]]):
     assert e.value.errors == [Error("value_errors", nested_errors=value_errors)]
 
 
-@contextmanager
-def assert_errors(errors: list[Error]):
-    with pytest.raises(SchemaError) as e:
-        yield
+class assert_errors:
+    """
+    Assert that the block raises :class:`SchemaError` with expected errors.
 
-    assert e.value.errors == errors
+    Plain class instead of a generator based context manager, it is entered by
+    almost every test.
+    """
 
+    __slots__ = ("_errors",)
 
-@contextmanager
-def assert_dict_key_errors(key_errors: dict[str, list[Error]]):
-    with assert_errors([Error("key_errors", nested_errors=key_errors)]):
-        yield
+    def __init__(self, errors: list[Error]):
+        self._errors = errors
 
+    def __enter__(self):
+        return self
 
-@contextmanager
-def assert_dict_value_errors(value_errors: dict[str, list[Error]]):
-    with assert_errors([Error("value_errors", nested_errors=value_errors)]):
-        yield
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            pytest.fail(f"DID NOT RAISE {SchemaError}")
 
+        if not issubclass(exc_type, SchemaError):
+            return False
 
-@contextmanager
-def assert_list_value_errors(value_errors: dict[str, list[Error]]):
-    with assert_errors([Error("value_errors", nested_errors=value_errors)]):
-        yield
+        assert exc.errors == self._errors
+        return True
+
+
+def assert_dict_key_errors(key_errors: dict[str, list[Error]]) -> assert_errors:
+    return assert_errors([Error("key_errors", nested_errors=key_errors)])
+
+
+def assert_dict_value_errors(value_errors: dict[str, list[Error]]) -> assert_errors:
+    return assert_errors([Error("value_errors", nested_errors=value_errors)])
+
+
+def assert_list_value_errors(value_errors: dict[str, list[Error]]) -> assert_errors:
+    return assert_errors([Error("value_errors", nested_errors=value_errors)])
 
 
 def validate_value_is_42_and_double_it(self, value, typecast: bool, context: dict):
@@ -44,3 +44,11 @@ def test_merge_nested_errors_when_key_already_exists():
     error.merge_nested_errors(nested_errors)
 
     assert error.nested_errors == {"key": [Error("key_oops_1"), Error("key_oops_2")]}
+
+
+def test_message_rendering_keeps_message_arguments():
+    error = Error("oops", {"type": Message("int", json="integer")}, message="{type}")
+
+    assert error.get_message("json") == "integer"
+    assert error.get_message() == "int"
+    assert error.args == {"type": Message("int", json="integer")}
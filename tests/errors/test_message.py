@@ -28,6 +28,11 @@ def test_performs_string_formatting():
     assert message.render(kwargs={"type": "int"}) == 'should be "int"'
 
 
+def test_performs_string_formatting_without_arguments():
+    message = Message("{{type}} is a placeholder")
+    assert message.render() == "{type} is a placeholder"
+
+
 def test_renders_message_arguments_for_string_formatting():
     message = Message('should be "{type}"')
     kwargs = {"type": Message("int", json="integer")}
@@ -33,3 +33,7 @@ def test_inheritance_message(collection: MessageCollection):
     assert child_collection.get_message("oops").render() == "Overriden Oops!"
     assert child_collection.get_message("ouch").render() == "Ouch!"
     assert child_collection.get_message("argh").render() == "Argh!"
+
+
+def test_unknown_message_is_reused(collection: MessageCollection):
+    assert collection.get_message("argh") is collection.get_message("argh")
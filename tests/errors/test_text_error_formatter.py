@@ -0,0 +1,31 @@
+from goodboy.errors import Error, TextErrorFormatter
+from goodboy.i18n import lazy_gettext
+from goodboy.messages import Message, type_name
+from tests.conftest import TranslationsMock
+
+
+def test_error_formatting():
+    formatter = TextErrorFormatter()
+
+    errors = [
+        Error("err_1"),
+        Error("err_2", {"expected_type": type_name("str")}),
+        Error("err_3", nested_errors={"key": [Error("err_4", {"value": 3})]}),
+    ]
+
+    assert formatter.format(errors) == "\n".join(
+        [
+            "err_1: err_1. ",
+            "err_2: err_2.  {'expected_type': 'str'}",
+            "err_3: err_3. ",
+            "    key:",
+            "        err_4: err_4.  {'value': 3}",
+        ]
+    )
+
+
+def test_message_arguments_are_translated():
+    formatter = TextErrorFormatter(TranslationsMock({"string": "строка"}))
+    errors = [Error("err", {"expected_type": [Message(lazy_gettext("string"))]})]
+
+    assert formatter.format(errors) == "err: err.  {'expected_type': ['строка']}"
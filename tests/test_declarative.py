@@ -1,3 +1,5 @@
+import pytest
+
 from goodboy.declarative import (
     _DEFAULT_DECLARATIVE_SCHEMA_FABRICS,
     DeclarativeBuilder,
@@ -16,133 +18,137 @@ from .conftest import assert_declarative_errors, dummy_rule
 ALLOWED_SCHEMA_NAMES = list(_DEFAULT_DECLARATIVE_SCHEMA_FABRICS.keys())
 
 
-def test_allows_only_known_schemas():
-    builder = DeclarativeBuilder()
+@pytest.fixture(scope="module")
+def builder():
+    return DeclarativeBuilder()
+
 
+def test_allows_only_known_schemas(builder):
     with assert_declarative_errors(
         {"type": [Error("not_allowed", {"allowed": ALLOWED_SCHEMA_NAMES})]}
     ):
         builder.build({"type": "spaceship"})
 
 
-def test_rejects_invalid_schema_options():
-    builder = DeclarativeBuilder()
-
+def test_rejects_invalid_schema_options(builder):
     with assert_declarative_errors({"max_length": [Error("less_than", {"value": 0})]}):
         builder.build({"type": "str", "max_length": -1})
 
 
-def test_declarative_build_any():
-    options = {
-        "allow_none": True,
-        "messages": {"oops": "Oops!"},
-        "rules": [dummy_rule],
-        "allowed": ["hello", 123],
-    }
-
-    assert build({"type": "any", **options}) == AnyValue(**options)
-
-
-def test_declarative_build_none():
-    options = {
-        "messages": {"oops": "Oops!"},
-        "rules": [dummy_rule],
-    }
-
-    assert build({"type": "none", **options}) == NoneValue(**options)
-
-
-def test_declarative_build_str():
-    options = {
-        "allow_none": True,
-        "messages": {"cannot_be_none": "No None here"},
-        "rules": [dummy_rule],
-        "allow_blank": False,
-        "min_length": 2,
-        "max_length": 5,
-        "length": 50,
-        "pattern": r"^\d+$",
-        "is_regex": False,
-        "allowed": ["123", "456"],
-    }
-
-    assert build({"type": "str", **options}) == Str(**options)
-
-
-def test_declarative_build_bool():
-    options = {
-        "allow_none": True,
-        "messages": {"cannot_be_none": "No None here"},
-        "rules": [dummy_rule],
-        "only_false": True,
-        "only_true": True,
-        "cast_anything": True,
-    }
-
-    assert build({"type": "bool", **options}) == Bool(**options)
-
-
-def test_declarative_build_int():
-    options = {
-        "allow_none": True,
-        "messages": {"cannot_be_none": "No None here"},
-        "rules": [dummy_rule],
-        "less_than": 10,
-        "less_or_equal_to": 9,
-        "greater_than": 0,
-        "greater_or_equal_to": 1,
-        "allowed": [123, 456],
-    }
-
-    assert build({"type": "int", **options}) == Int(**options)
-
-
-def test_declarative_build_float():
-    options = {
-        "allow_none": True,
-        "messages": {"cannot_be_none": "No None here"},
-        "rules": [dummy_rule],
-        "less_than": 10.0,
-        "less_or_equal_to": 9.0,
-        "greater_than": 0.0,
-        "greater_or_equal_to": 1.0,
-        "allowed": [123.0, 456.0],
-    }
-
-    assert build({"type": "float", **options}) == Float(**options)
-
-
-def test_declarative_build_date():
-    options = {
-        "allow_none": True,
-        "messages": {"cannot_be_none": "No None here"},
-        "rules": [dummy_rule],
-        "earlier_than": "2010-01-01",
-        "earlier_or_equal_to": "2009-12-31",
-        "later_than": "1999-12-31",
-        "later_or_equal_to": "2000-01-01",
-        "allowed": ["2000-01-01", "2009-12-31"],
-    }
-
-    assert build({"type": "date", **options}) == Date(**options)
-
-
-def test_declarative_build_datetime():
-    options = {
-        "allow_none": True,
-        "messages": {"cannot_be_none": "No None here"},
-        "rules": [dummy_rule],
-        "earlier_than": "2010-01-01T00:00:00",
-        "earlier_or_equal_to": "2009-12-31T00:00:00",
-        "later_than": "1999-12-31T00:00:00",
-        "later_or_equal_to": "2000-01-01T00:00:00",
-        "allowed": ["2000-01-01T00:00:00", "2009-12-31T00:00:00"],
-    }
-
-    assert build({"type": "datetime", **options}) == DateTime(**options)
+@pytest.mark.parametrize(
+    "type_name,schema_class,options",
+    [
+        (
+            "any",
+            AnyValue,
+            {
+                "allow_none": True,
+                "messages": {"oops": "Oops!"},
+                "rules": [dummy_rule],
+                "allowed": ["hello", 123],
+            },
+        ),
+        (
+            "none",
+            NoneValue,
+            {
+                "messages": {"oops": "Oops!"},
+                "rules": [dummy_rule],
+            },
+        ),
+        (
+            "str",
+            Str,
+            {
+                "allow_none": True,
+                "messages": {"cannot_be_none": "No None here"},
+                "rules": [dummy_rule],
+                "allow_blank": False,
+                "min_length": 2,
+                "max_length": 5,
+                "length": 50,
+                "pattern": r"^\d+$",
+                "is_regex": False,
+                "allowed": ["123", "456"],
+            },
+        ),
+        (
+            "bool",
+            Bool,
+            {
+                "allow_none": True,
+                "messages": {"cannot_be_none": "No None here"},
+                "rules": [dummy_rule],
+                "only_false": True,
+                "only_true": True,
+                "cast_anything": True,
+            },
+        ),
+        (
+            "int",
+            Int,
+            {
+                "allow_none": True,
+                "messages": {"cannot_be_none": "No None here"},
+                "rules": [dummy_rule],
+                "less_than": 10,
+                "less_or_equal_to": 9,
+                "greater_than": 0,
+                "greater_or_equal_to": 1,
+                "allowed": [123, 456],
+            },
+        ),
+        (
+            "float",
+            Float,
+            {
+                "allow_none": True,
+                "messages": {"cannot_be_none": "No None here"},
+                "rules": [dummy_rule],
+                "less_than": 10.0,
+                "less_or_equal_to": 9.0,
+                "greater_than": 0.0,
+                "greater_or_equal_to": 1.0,
+                "allowed": [123.0, 456.0],
+            },
+        ),
+        (
+            "date",
+            Date,
+            {
+                "allow_none": True,
+                "messages": {"cannot_be_none": "No None here"},
+                "rules": [dummy_rule],
+                "earlier_than": "2010-01-01",
+                "earlier_or_equal_to": "2009-12-31",
+                "later_than": "1999-12-31",
+                "later_or_equal_to": "2000-01-01",
+                "allowed": ["2000-01-01", "2009-12-31"],
+            },
+        ),
+        (
+            "datetime",
+            DateTime,
+            {
+                "allow_none": True,
+                "messages": {"cannot_be_none": "No None here"},
+                "rules": [dummy_rule],
+                "earlier_than": "2010-01-01T00:00:00",
+                "earlier_or_equal_to": "2009-12-31T00:00:00",
+                "later_than": "1999-12-31T00:00:00",
+                "later_or_equal_to": "2000-01-01T00:00:00",
+                "allowed": ["2000-01-01T00:00:00", "2009-12-31T00:00:00"],
+            },
+        ),
+    ],
+)
+def test_declarative_build_simple_schema(builder, type_name, schema_class, options):
+    schema = schema_class(**options)
+    assert builder.build({"type": type_name, **options}) == schema
+    assert build({"type": type_name, **options}) == schema
 
 
-def test_declarative_build_dict():
+def test_declarative_build_dict(builder):
     options = {
         "allow_none": True,
         "messages": {"cannot_be_none": "No None here"},
@@ -177,10 +183,10 @@ def test_declarative_build_dict():
         keys_required_by_default=False,
     )
 
-    assert build({"type": "dict", **options}) == schema
+    assert builder.build({"type": "dict", **options}) == schema
 
 
-def test_declarative_build_list():
+def test_declarative_build_list(builder):
     options = {
         "allow_none": True,
         "messages": {"cannot_be_none": "No None here"},
@@ -201,10 +207,10 @@ def test_declarative_build_list():
         length=7,
     )
 
-    assert build({"type": "list", **options}) == schema
+    assert builder.build({"type": "list", **options}) == schema
 
 
-def test_declarative_build_any_of():
+def test_declarative_build_any_of(builder):
     options = {
         "schemas": [
             {"type": "str"},
@@ -220,4 +226,4 @@ def test_declarative_build_any_of():
         rules=[dummy_rule],
     )
 
-    assert build({"type": "any_of", **options}) == schema
+    assert builder.build({"type": "any_of", **options}) == schema
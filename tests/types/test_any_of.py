@@ -1,4 +1,5 @@
 from goodboy.errors import Error
+from goodboy.types.numeric import Int
 from goodboy.types.simple import Str
 from goodboy.types.variants import AnyOf
 from tests.conftest import assert_errors
@@ -38,3 +39,12 @@ def test_applies_rules_when_value_not_is_invalid():
 
     with assert_errors([expected_anyof_error, expected_rule_error]):
         schema("oops")
+
+
+def test_is_valid_uses_any_of_call():
+    schema = AnyOf([Str(allow_none=True), Int()])
+
+    assert schema.is_valid(None)
+    assert schema.is_valid("1", typecast=True)
+    assert schema.is_valid(1)
+    assert not schema.is_valid(1.5)
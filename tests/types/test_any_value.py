@@ -7,23 +7,28 @@ from goodboy.types.simple import AnyValue
 from tests.conftest import assert_errors, validate_value_is_42_and_double_it
 
 
-def test_none():
+@pytest.fixture(scope="module")
+def any_value_schema():
+    return AnyValue()
+
+
+def test_none(any_value_schema):
     with assert_errors([Error("cannot_be_none", {})]):
-        AnyValue()(None)
+        any_value_schema(None)
 
     assert AnyValue(allow_none=True)(None) is None
 
 
-def test_value():
-    assert AnyValue()("ok") == "ok"
-    assert AnyValue()(42) == 42
+def test_value(any_value_schema):
+    assert any_value_schema("ok") == "ok"
+    assert any_value_schema(42) == 42
 
 
-def test_allow_none():
+def test_allow_none(any_value_schema):
     assert AnyValue(allow_none=True)(None) is None
 
     with assert_errors([Error("cannot_be_none")]):
-        AnyValue()(None)
+        any_value_schema(None)
 
 
 def test_accepts_allowed_value():
@@ -65,18 +70,25 @@ def test_ignores_rules_when_value_is_none_and_allowed():
     assert schema(None) is None
 
 
+_OVERRIDE_MESSAGE_TEXT = "no None here please"
+_OVERRIDE_MESSAGE = Message(_OVERRIDE_MESSAGE_TEXT)
+_OVERRIDE_MESSAGE_COLLECTION = MessageCollection({"cannot_be_none": _OVERRIDE_MESSAGE})
+_OVERRIDE_MESSAGE_DICT_WITH_OBJ = {"cannot_be_none": _OVERRIDE_MESSAGE}
+_OVERRIDE_MESSAGE_DICT_WITH_STR = {"cannot_be_none": _OVERRIDE_MESSAGE_TEXT}
+
+
 @pytest.mark.parametrize(
     "messages",
     [
-        MessageCollection({"cannot_be_none": Message("no None here please")}),
-        {"cannot_be_none": Message("no None here please")},
-        {"cannot_be_none": "no None here please"},
+        _OVERRIDE_MESSAGE_COLLECTION,
+        _OVERRIDE_MESSAGE_DICT_WITH_OBJ,
+        _OVERRIDE_MESSAGE_DICT_WITH_STR,
     ],
 )
 def test_messages_override(messages):
     try:
         AnyValue(messages=messages)(None)
     except SchemaError as e:
-        assert e.errors[0].get_message() == "no None here please"
+        assert e.errors[0].get_message() == _OVERRIDE_MESSAGE_TEXT
     else:
         pytest.fail("exception was not raised")
@@ -5,49 +5,51 @@ from goodboy.messages import type_name
 from goodboy.types.simple import Bool
 from tests.conftest import assert_errors
 
+_UNEXPECTED_BOOL = Error("unexpected_type", {"expected_type": type_name("bool")})
+
+
+@pytest.fixture(scope="module")
+def bool_schema():
+    return Bool()
+
 
 def test_accepts_none_when_none_allowed():
     assert Bool(allow_none=True)(None) is None
 
 
-def test_rejects_none_when_none_denied():
+def test_rejects_none_when_none_denied(bool_schema):
     with assert_errors([Error("cannot_be_none")]):
-        Bool()(None)
+        bool_schema(None)
 
 
 @pytest.mark.parametrize(
-    "good_input,result",
+    "schema_kwargs,good_input,result",
     [
-        ("true", True),
-        ("false", False),
+        ({}, "true", True),
+        ({}, "false", False),
+        ({}, True, True),
+        ({"cast_anything": True}, {}, False),
+        ({"cast_anything": True}, {"hello": "world"}, True),
     ],
 )
-def test_type_casting_accepts_good_input(good_input, result):
-    assert Bool()(good_input, typecast=True) is result
-
-
-def test_type_casting_rejects_bad_input():
-    with assert_errors(
-        [Error("unexpected_type", {"expected_type": type_name("bool")})]
-    ):
-        Bool()("oops", typecast=True)
+def test_type_casting_accepts_good_input(schema_kwargs, good_input, result):
+    assert Bool(**schema_kwargs)(good_input, typecast=True) is result
 
 
-def test_type_casting_accepts_any_value_when_cast_anything_enabled():
-    Bool(cast_anything=True)({}, typecast=True) is False
-    Bool(cast_anything=True)({"hello": "world"}, typecast=True) is True
+@pytest.mark.parametrize("bad_input", ["oops", 42])
+def test_type_casting_rejects_bad_input(bool_schema, bad_input):
+    with assert_errors([_UNEXPECTED_BOOL]):
+        bool_schema(bad_input, typecast=True)
 
 
-def test_accepts_bool_type():
-    assert Bool()(True) is True
-    assert Bool()(False) is False
+def test_accepts_bool_type(bool_schema):
+    assert bool_schema(True) is True
+    assert bool_schema(False) is False
 
 
-def test_rejects_non_str_type():
-    with assert_errors(
-        [Error("unexpected_type", {"expected_type": type_name("bool")})]
-    ):
-        Bool()("true")
+def test_rejects_non_str_type(bool_schema):
+    with assert_errors([_UNEXPECTED_BOOL]):
+        bool_schema("true")
 
 
 def test_only_true_option_accepts_true_value():
@@ -82,9 +84,7 @@ def test_ignores_rules_when_value_is_none_and_allowed():
 
 
 def test_ignores_rules_when_value_has_unexpected_type():
-    with assert_errors(
-        [Error("unexpected_type", {"expected_type": type_name("bool")})]
-    ):
+    with assert_errors([_UNEXPECTED_BOOL]):
         Bool(rules=[invert_value])(42)
 
 
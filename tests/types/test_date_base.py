@@ -25,6 +25,10 @@ class TestDateBase:
         with assert_errors([Error("cannot_be_none")]):
             schema(None)
 
+    def test_none_check_precedes_allowed(self, schema_class, value):
+        schema = schema_class(allowed=[value], allow_none=True)
+        assert schema(None) is None
+
     def test_earlier_than_option_accepts_good_value(self, schema_class, value):
         schema = schema_class(earlier_than=value)
         assert schema(value - timedelta(days=1)) == value - timedelta(days=1)
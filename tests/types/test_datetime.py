@@ -1,125 +1,116 @@
 from datetime import datetime
 
+import pytest
+
 from goodboy.errors import Error
 from goodboy.messages import type_name
 from goodboy.types.dates import DateTime
 from tests.conftest import assert_errors, validate_value_has_odd_year
 
-
-def test_accepts_datetime_type():
-    schema = DateTime()
-    good_value = datetime(1985, 10, 26, 9, 0, 0)
-
-    assert schema(good_value) == good_value
-
-
-def test_rejects_non_datetime_type():
-    schema = DateTime()
-    bad_value = "1985-10-26T09:00:00"
-
-    with assert_errors(
-        [Error("unexpected_type", {"expected_type": type_name("datetime")})]
-    ):
-        schema(bad_value)
-
-
-def test_type_casting_accepts_good_input_with_default_format():
-    schema = DateTime()
-    good_input = "1985-10-26T09:00:00"
-    value = datetime(1985, 10, 26, 9, 0, 0)
-
-    assert schema(good_input, typecast=True) == value
-
-
-def test_type_casting_rejects_bad_input_with_default_format():
-    schema = DateTime()
-    bad_input = "1985/10/26 09:00:00"
-
-    with assert_errors([Error("invalid_datetime_format")]):
-        schema(bad_input, typecast=True)
+_UNEXPECTED_DATETIME = Error(
+    "unexpected_type", {"expected_type": type_name("datetime")}
+)
+_ALLOWED_DATETIMES = [datetime(1985, 10, 26, 9, 0, 0), datetime(2015, 10, 21, 7, 28, 0)]
 
 
-def test_type_casting_accepts_good_input_with_custom_format():
-    schema = DateTime(format="%Y/%m/%d %H:%M:%S")
-    good_input = "1985/10/26 09:00:00"
-    value = datetime(1985, 10, 26, 9, 0, 0)
+@pytest.fixture(scope="module")
+def datetime_schema():
+    return DateTime()
 
-    assert schema(good_input, typecast=True) == value
 
+def test_accepts_datetime_type(datetime_schema):
+    good_value = datetime(1985, 10, 26, 9, 0, 0)
 
-def test_type_casting_rejects_bad_input_with_custom_format():
-    schema = DateTime(format="%Y/%m/%d %H:%M:%S")
-    bad_input = "1985-10-26T09:00:00"
-
-    with assert_errors([Error("invalid_datetime_format")]):
-        schema(bad_input, typecast=True)
+    assert datetime_schema(good_value) == good_value
 
 
-def test_type_casting_accepts_good_input_with_custom_format_from_context():
-    schema = DateTime(format="should_not_be_used")
-    good_input = "1985/10/26 09:00:00"
-    value = datetime(1985, 10, 26, 9, 0, 0)
-    context = {"date_format": "%Y/%m/%d %H:%M:%S"}
+def test_rejects_non_datetime_type(datetime_schema):
+    bad_value = "1985-10-26T09:00:00"
 
+    with assert_errors([_UNEXPECTED_DATETIME]):
+        datetime_schema(bad_value)
+
+
+@pytest.mark.parametrize(
+    "schema_kwargs,context,good_input,value",
+    [
+        ({}, {}, "1985-10-26T09:00:00", datetime(1985, 10, 26, 9, 0, 0)),
+        (
+            {"format": "%Y/%m/%d %H:%M:%S"},
+            {},
+            "1985/10/26 09:00:00",
+            datetime(1985, 10, 26, 9, 0, 0),
+        ),
+        (
+            {"format": "%Y/%m/%d %H:%M:%S"},
+            {},
+            "1985/10/26 9:00:00",
+            datetime(1985, 10, 26, 9, 0, 0),
+        ),
+        (
+            {"format": "should_not_be_used"},
+            {"date_format": "%Y/%m/%d %H:%M:%S"},
+            "1985/10/26 09:00:00",
+            datetime(1985, 10, 26, 9, 0, 0),
+        ),
+        ({}, {}, datetime(1985, 10, 26, 9, 0, 0), datetime(1985, 10, 26, 9, 0, 0)),
+    ],
+)
+def test_type_casting_accepts_good_input(schema_kwargs, context, good_input, value):
+    schema = DateTime(**schema_kwargs)
     assert schema(good_input, typecast=True, context=context) == value
 
 
-def test_type_casting_rejects_bad_input_with_custom_format_from_context():
-    schema = DateTime(format="should_not_be_used")
-    bad_input = "1985-10-26T09:00:00"
-    context = {"date_format": "%Y/%m/%d %H:%M:%S"}
-
-    with assert_errors([Error("invalid_datetime_format")]):
+@pytest.mark.parametrize(
+    "schema_kwargs,context,bad_input,errors",
+    [
+        ({}, {}, "1985/10/26 09:00:00", [Error("invalid_datetime_format")]),
+        (
+            {"format": "%Y/%m/%d %H:%M:%S"},
+            {},
+            "1985-10-26T09:00:00",
+            [Error("invalid_datetime_format")],
+        ),
+        (
+            {"format": "%Y/%m/%d %H:%M:%S"},
+            {},
+            "1985/10/26 24:00:00",
+            [Error("invalid_datetime_format")],
+        ),
+        (
+            {"format": "should_not_be_used"},
+            {"date_format": "%Y/%m/%d %H:%M:%S"},
+            "1985-10-26T09:00:00",
+            [Error("invalid_datetime_format")],
+        ),
+        ({}, {}, 42, [_UNEXPECTED_DATETIME]),
+    ],
+)
+def test_type_casting_rejects_bad_input(schema_kwargs, context, bad_input, errors):
+    schema = DateTime(**schema_kwargs)
+
+    with assert_errors(errors):
         schema(bad_input, typecast=True, context=context)
 
 
-def test_type_casting_accepts_date_values():
-    schema = DateTime()
-    good_input = datetime(1985, 10, 26, 9, 0, 0)
-
-    assert schema(good_input, typecast=True) == good_input
-
-
-def test_type_casting_rejects_non_string_values():
-    schema = DateTime()
-    bad_input = 42
-
-    with assert_errors(
-        [Error("unexpected_type", {"expected_type": type_name("datetime")})]
-    ):
-        schema(bad_input, typecast=True)
-
-
 def test_accepts_allowed_value():
-    schema = DateTime(
-        allowed=[datetime(1985, 10, 26, 9, 0, 0), datetime(2015, 10, 21, 7, 28, 0)]
-    )
-    assert schema(datetime(1985, 10, 26, 9, 0, 0)) == datetime(1985, 10, 26, 9, 0, 0)
-    assert schema(datetime(2015, 10, 21, 7, 28, 0)) == datetime(2015, 10, 21, 7, 28, 0)
-
+    schema = DateTime(allowed=_ALLOWED_DATETIMES)
 
-def test_none_check_precedes_allowed():
-    schema = DateTime(
-        allowed=[datetime(1985, 10, 26, 9, 0, 0), datetime(2015, 10, 21, 7, 28, 0)],
-        allow_none=True,
-    )
-    assert schema(None) is None
+    for allowed_value in _ALLOWED_DATETIMES:
+        assert schema(allowed_value) == allowed_value
 
 
 def test_rejects_not_allowed_value():
-    allowed = [datetime(1985, 10, 26, 9, 0, 0), datetime(2015, 10, 21, 7, 28, 0)]
-    schema = DateTime(allowed=allowed)
+    schema = DateTime(allowed=_ALLOWED_DATETIMES)
 
-    with assert_errors([Error("not_allowed", {"allowed": allowed})]):
+    with assert_errors([Error("not_allowed", {"allowed": _ALLOWED_DATETIMES})]):
         schema(datetime(1955, 11, 12, 6, 38, 00))
 
 
 def test_ignores_rules_when_value_has_unexpected_type():
     schema = DateTime(rules=[validate_value_has_odd_year])
 
-    with assert_errors(
-        [Error("unexpected_type", {"expected_type": type_name("datetime")})]
-    ):
+    with assert_errors([_UNEXPECTED_DATETIME]):
         schema("oops")
 
 
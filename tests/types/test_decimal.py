@@ -65,6 +65,11 @@ def test_rejects_not_allowed_value():
         schema(Decimal("150.0"))
 
 
+def test_accepts_allowed_value_when_signaling_nan_is_allowed():
+    schema = DecimalSchema(allowed=[Decimal("42.0"), Decimal("sNaN")])
+    assert schema(Decimal("42.0")) == Decimal("42.0")
+
+
 def test_ignores_rules_when_value_has_unexpected_type():
     schema = DecimalSchema(rules=[validate_value_is_42_and_double_it])
 
@@ -4,6 +4,7 @@ import pytest
 
 from goodboy.errors import Error
 from goodboy.messages import type_name
+from goodboy.schema import SchemaError
 from goodboy.types.dates import Date
 from goodboy.types.dicts import Dict, Key
 from goodboy.types.simple import AnyValue, Str
@@ -14,6 +15,33 @@ from tests.conftest import (
 )
 
 
+@pytest.fixture(scope="module")
+def date_key_schema():
+    return Dict(keys=[Key("d", Date())])
+
+
+@pytest.fixture(scope="module")
+def lambda_predicate_schema():
+    return Dict(
+        keys=[
+            Key("field", Str()),
+            Key("value", Str(), predicate=lambda d: d.get("field") == "name"),
+            Key("value", Date(), predicate=lambda d: d.get("field") == "birthday"),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def expr_predicate_schema():
+    return Dict(
+        keys=[
+            Key("field", Str()),
+            Key("value", Str(), predicate=("$field", "==", "name")),
+            Key("value", Date(), predicate=("$field", "==", "birthday")),
+        ]
+    )
+
+
 def test_accepts_none_when_none_allowed():
     assert Dict(allow_none=True)(None) is None
 
@@ -38,6 +66,14 @@ def test_accepts_dict_type():
     assert Dict()({}) == {}
 
 
+def test_returns_dict_copy():
+    good_value = {"foo": 1}
+    result = Dict()(good_value)
+
+    assert result == good_value
+    assert result is not good_value
+
+
 def test_rejects_non_dict_type():
     with assert_errors(
         [Error("unexpected_type", {"expected_type": type_name("dict")})]
@@ -90,6 +126,20 @@ def test_rejects_unknown_key():
         schema({"oops": True})
 
 
+def test_returns_new_errors_on_each_call():
+    schema = Dict(keys=[])
+
+    with pytest.raises(SchemaError) as exc_info:
+        schema({"oops": True})
+
+    exc_info.value.errors[0].nested_errors["oops"][0].merge_nested_errors(
+        {"nested": [Error("mutated")]}
+    )
+
+    with assert_dict_key_errors({"oops": [Error("unknown_key")]}):
+        schema({"oops": True})
+
+
 def test_returns_default_value_for_absent_key():
     schema = Dict(keys=[Key("default_key", default="foo")])
     assert schema({}) == {"default_key": "foo"}
@@ -189,22 +239,20 @@ def test_rejects_invalid_values():
         schema(bad_value)
 
 
-def test_passes_typecast_flag_to_key_schemas():
-    schema = Dict(keys=[Key("d", Date())])
-
-    assert schema({"d": "1970-01-01"}, typecast=True) == {"d": date(1970, 1, 1)}
+def test_passes_typecast_flag_to_key_schemas(date_key_schema):
+    assert date_key_schema({"d": "1970-01-01"}, typecast=True) == {
+        "d": date(1970, 1, 1)
+    }
 
     with assert_dict_value_errors(
         {"d": [Error("unexpected_type", {"expected_type": type_name("date")})]}
     ):
-        schema({"d": "1970-01-01"})
+        date_key_schema({"d": "1970-01-01"})
 
 
-def test_rejects_values_with_typecasting_errors():
-    schema = Dict(keys=[Key("d", Date())])
-
+def test_rejects_values_with_typecasting_errors(date_key_schema):
     with assert_dict_value_errors({"d": [Error("invalid_date_format")]}):
-        schema({"d": "1970/01/01"}, typecast=True)
+        date_key_schema({"d": "1970/01/01"}, typecast=True)
 
 
 @pytest.mark.parametrize(
@@ -214,16 +262,10 @@ def test_rejects_values_with_typecasting_errors():
         {"field": "birthday", "value": date(1968, 6, 12)},
     ],
 )
-def test_accepts_values_when_lambda_predicate_succeed(good_value):
-    schema = Dict(
-        keys=[
-            Key("field", Str()),
-            Key("value", Str(), predicate=lambda d: d.get("field") == "name"),
-            Key("value", Date(), predicate=lambda d: d.get("field") == "birthday"),
-        ]
-    )
-
-    assert schema(good_value) == good_value
+def test_accepts_values_when_lambda_predicate_succeed(
+    lambda_predicate_schema, good_value
+):
+    assert lambda_predicate_schema(good_value) == good_value
 
 
 @pytest.mark.parametrize(
@@ -233,19 +275,13 @@ def test_accepts_values_when_lambda_predicate_succeed(good_value):
         ({"field": "birthday", "value": "Marty"}, type_name("date")),
     ],
 )
-def test_rejects_values_when_lambda_predicate_failed(bad_value, type_name):
-    schema = Dict(
-        keys=[
-            Key("field", Str()),
-            Key("value", Str(), predicate=lambda d: d.get("field") == "name"),
-            Key("value", Date(), predicate=lambda d: d.get("field") == "birthday"),
-        ]
-    )
-
+def test_rejects_values_when_lambda_predicate_failed(
+    lambda_predicate_schema, bad_value, type_name
+):
     with assert_dict_value_errors(
         {"value": [Error("unexpected_type", {"expected_type": type_name})]}
     ):
-        schema(bad_value)
+        lambda_predicate_schema(bad_value)
 
 
 @pytest.mark.parametrize(
@@ -255,16 +291,8 @@ def test_rejects_values_when_lambda_predicate_failed(bad_value, type_name):
         {"field": "birthday", "value": date(1968, 6, 12)},
     ],
 )
-def test_accepts_values_when_expr_predicate_succeed(good_value):
-    schema = Dict(
-        keys=[
-            Key("field", Str()),
-            Key("value", Str(), predicate=("$field", "==", "name")),
-            Key("value", Date(), predicate=("$field", "==", "birthday")),
-        ]
-    )
-
-    assert schema(good_value) == good_value
+def test_accepts_values_when_expr_predicate_succeed(expr_predicate_schema, good_value):
+    assert expr_predicate_schema(good_value) == good_value
 
 
 @pytest.mark.parametrize(
@@ -274,19 +302,37 @@ def test_accepts_values_when_expr_predicate_succeed(good_value):
         ({"field": "birthday", "value": "Marty"}, type_name("date")),
     ],
 )
-def test_rejects_values_when_expr_predicate_failed(bad_value, type_name):
-    schema = Dict(
-        keys=[
-            Key("field", Str()),
-            Key("value", Str(), predicate=("$field", "==", "name")),
-            Key("value", Date(), predicate=("$field", "==", "birthday")),
-        ]
-    )
-
+def test_rejects_values_when_expr_predicate_failed(
+    expr_predicate_schema, bad_value, type_name
+):
     with assert_dict_value_errors(
         {"value": [Error("unexpected_type", {"expected_type": type_name})]}
     ):
-        schema(bad_value)
+        expr_predicate_schema(bad_value)
+
+
+@pytest.mark.parametrize(
+    "predicate,result",
+    [
+        (("$a", "==", 1), True),
+        (("$a", "!=", 1), False),
+        (("$a", "<", "$b"), True),
+        (("$b", "<=", 1), False),
+        ((2, ">", "$a"), True),
+        (("$missing", "==", None), True),
+        (("$a", "and", "$zero"), False),
+        (("$zero", "or", "$a"), True),
+    ],
+)
+def test_evaluates_expr_predicate(predicate, result):
+    values = {"a": 1, "b": 2, "zero": 0}
+
+    assert bool(Key("key", predicate=predicate).predicate_result(values)) is result
+
+
+def test_key_rejects_unknown_expr_predicate_operator():
+    with pytest.raises(ValueError):
+        Key("key", predicate=("$a", "<>", 1))
 
 
 def test_applies_rules_when_value_not_none_and_has_expected_type():
@@ -295,7 +341,10 @@ def test_applies_rules_when_value_not_none_and_has_expected_type():
     with assert_errors([Error("key_count_is_not_odd")]):
         schema({})
 
-    assert schema({"foo": 0}) == {"foo": 0, "bar": 1}
+    good_value = {"foo": 0}
+
+    assert schema(good_value) == {"foo": 0, "bar": 1}
+    assert good_value == {"foo": 0}
 
 
 def test_ignores_rules_when_value_is_none_and_denied():
@@ -375,7 +424,9 @@ def validate_keys_count_is_odd_and_add_bar_dict_key(
     self: Dict, value, typecast: bool, context: dict
 ):
     if len(value.keys()) % 2 == 1:
-        return {**value, "bar": 1}, []
+        # Dict passes rules its own result dict, so it can be modified in place
+        value["bar"] = 1
+        return value, []
     else:
         return value, [self._error("key_count_is_not_odd")]
 
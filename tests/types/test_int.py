@@ -61,3 +61,14 @@ def test_ignores_rules_when_value_has_unexpected_type():
 
     with assert_errors([Error("unexpected_type", {"expected_type": type_name("int")})]):
         schema("42")
+
+
+def test_is_valid():
+    schema = Int(allowed=[42])
+
+    assert schema.is_valid(42)
+    assert schema.is_valid("42", typecast=True)
+    assert not schema.is_valid(None)
+    assert not schema.is_valid(100)
+    assert not schema.is_valid("42")
+    assert not schema.is_valid("oops", typecast=True)
@@ -23,7 +23,7 @@ class TestNumeric:
 
         assert schema(good_value) == good_value
 
-    @pytest.mark.parametrize("bad_value", [0, 1])
+    @pytest.mark.parametrize("bad_value", (0, 1))
     def test_less_than_option_rejects_bad_values(self, type_class, bad_value):
         less_than_value = 0
         schema = type_class(less_than=less_than_value)
@@ -31,7 +31,7 @@ class TestNumeric:
         with assert_errors([Error("greater_or_equal_to", {"value": less_than_value})]):
             schema(bad_value)
 
-    @pytest.mark.parametrize("good_value", [0, -1])
+    @pytest.mark.parametrize("good_value", (0, -1))
     def test_less_or_equal_to_option_accepts_good_values(self, type_class, good_value):
         schema = type_class(less_or_equal_to=0)
         assert schema(good_value) == good_value
@@ -50,7 +50,7 @@ class TestNumeric:
 
         assert schema(good_value) == good_value
 
-    @pytest.mark.parametrize("bad_value", [0, -1])
+    @pytest.mark.parametrize("bad_value", (0, -1))
     def test_greater_than_option_rejects_bad_values(self, type_class, bad_value):
         greater_than_value = 0
         schema = type_class(greater_than=greater_than_value)
@@ -58,7 +58,7 @@ class TestNumeric:
         with assert_errors([Error("less_or_equal_to", {"value": greater_than_value})]):
             schema(bad_value)
 
-    @pytest.mark.parametrize("good_value", [0, 1])
+    @pytest.mark.parametrize("good_value", (0, 1))
     def test_greater_or_equal_to_option_accepts_good_values(
         self, type_class, good_value
     ):
@@ -7,113 +7,86 @@ from goodboy.messages import type_name
 from goodboy.types.simple import Str
 from tests.conftest import assert_errors
 
+_UNEXPECTED_STR = Error("unexpected_type", {"expected_type": type_name("str")})
+_ALLOWED = ["foo", "bar"]
+_DIGITS_PATTERN = r"^\d+$"
+_DIGITS_RE = re.compile(_DIGITS_PATTERN)
+
+
+@pytest.fixture(scope="module")
+def str_schema():
+    return Str()
+
 
 def test_accepts_none_when_none_allowed():
     schema = Str(allow_none=True)
     assert schema(None) is None
 
 
-def test_rejects_none_when_none_denied():
-    schema = Str()
-
+def test_rejects_none_when_none_denied(str_schema):
     with assert_errors([Error("cannot_be_none")]):
-        schema(None)
+        str_schema(None)
 
 
-def test_type_casting_accepts_good_input():
-    schema = Str()
+def test_type_casting_accepts_good_input(str_schema):
     good_input = "42"
 
-    assert schema(good_input, typecast=True) == good_input
+    assert str_schema(good_input, typecast=True) == good_input
 
 
-def test_type_casting_rejects_bad_input():
-    schema = Str()
+def test_type_casting_rejects_bad_input(str_schema):
     bad_input = 42
 
-    with assert_errors([Error("unexpected_type", {"expected_type": type_name("str")})]):
-        schema(bad_input, typecast=True)
+    with assert_errors([_UNEXPECTED_STR]):
+        str_schema(bad_input, typecast=True)
 
 
-def test_accepts_str_type():
-    schema = Str()
+def test_accepts_str_type(str_schema):
     good_value = "42"
 
-    assert schema(good_value) == good_value
+    assert str_schema(good_value) == good_value
 
 
-def test_rejects_non_str_type():
-    schema = Str()
+def test_rejects_non_str_type(str_schema):
     bad_value = 42
 
-    with assert_errors([Error("unexpected_type", {"expected_type": type_name("str")})]):
-        schema(bad_value)
+    with assert_errors([_UNEXPECTED_STR]):
+        str_schema(bad_value)
 
 
 def test_accepts_blank_string_when_enabled():
-    schema = Str(allow_blank=True, min_length=10, pattern=r"^\d+$")
+    schema = Str(allow_blank=True, min_length=10, pattern=_DIGITS_PATTERN)
     good_value = ""
 
     assert schema(good_value) == good_value
 
 
 def test_accepts_blank_string_when_disabled():
-    schema = Str(min_length=10, pattern=r"^\d+$")
+    schema = Str(min_length=10, pattern=_DIGITS_PATTERN)
     bad_value = ""
 
     with assert_errors([Error("cannot_be_blank")]):
         schema(bad_value)
 
 
-def test_min_length_option_accepts_good_value():
-    schema = Str(min_length=5)
-    good_value = "hello"
+@pytest.mark.parametrize(
+    "option,good_value,bad_value,error_code",
+    [
+        ("min_length", "hello", "oops", "string_too_short"),
+        ("max_length", "hello", "hello world", "string_too_long"),
+        ("length", "hello", "hello world", "invalid_string_length"),
+    ],
+)
+def test_length_options(option, good_value, bad_value, error_code):
+    schema = Str(**{option: 5})
 
     assert schema(good_value) == good_value
 
-
-def test_min_length_option_rejects_bad_value():
-    min_length_value = 5
-    schema = Str(min_length=min_length_value)
-    bad_value = "oops"
-
-    with assert_errors([Error("string_too_short", {"value": min_length_value})]):
+    with assert_errors([Error(error_code, {"value": 5})]):
         schema(bad_value)
 
 
-def test_max_length_option_accepts_good_value():
-    schema = Str(max_length=5)
-    good_value = "hello"
-
-    assert schema(good_value) == good_value
-
-
-def test_max_length_option_rejects_bad_value():
-    max_length_value = 5
-    schema = Str(max_length=max_length_value)
-    bad_value = "hello world"
-
-    with assert_errors([Error("string_too_long", {"value": max_length_value})]):
-        schema(bad_value)
-
-
-def test_length_option_accepts_good_value():
-    schema = Str(length=5)
-    good_value = "hello"
-
-    assert schema(good_value) == good_value
-
-
-def test_length_option_rejects_good_value():
-    length_value = 5
-    schema = Str(length=length_value)
-    bad_value = "hello world"
-
-    with assert_errors([Error("invalid_string_length", {"value": length_value})]):
-        schema(bad_value)
-
-
-@pytest.mark.parametrize("pattern", (r"^\d+$", re.compile(r"^\d+$")))
+@pytest.mark.parametrize("pattern", (_DIGITS_PATTERN, _DIGITS_RE))
 def test_pattern_option_accepts_good_string(pattern):
     schema = Str(pattern=pattern)
     good_string = "42"
@@ -121,7 +94,7 @@ def test_pattern_option_accepts_good_string(pattern):
     assert schema(good_string) == good_string
 
 
-@pytest.mark.parametrize("pattern", (r"^\d+$", re.compile(r"^\d+$")))
+@pytest.mark.parametrize("pattern", (_DIGITS_PATTERN, _DIGITS_RE))
 def test_pattern_option_rejects_bad_string(pattern):
     schema = Str(pattern=pattern)
     bad_string = "oops"
@@ -130,43 +103,44 @@ def test_pattern_option_rejects_bad_string(pattern):
         schema(bad_string)
 
 
-def test_is_regex_option_accepts_valid_re():
-    schema = Str(is_regex=True)
-    good_string = "^hello$"
-
-    assert schema(good_string) == good_string
-
-
-def test_is_regex_option_rejects_invalid_re():
+def test_is_regex_option():
     schema = Str(is_regex=True)
-    bad_string = "**"
+    assert schema("^hello$") == "^hello$"
 
     with assert_errors([Error("invalid_regex")]):
-        schema(bad_string)
+        schema("**")
 
 
 def test_accepts_allowed_value():
-    schema = Str(allowed=["foo", "bar"])
+    schema = Str(allowed=_ALLOWED)
     assert schema("foo") == "foo"
     assert schema("bar") == "bar"
 
 
 def test_none_check_precedes_allowed():
-    schema = Str(allowed=["foo", "bar"], allow_none=True)
+    schema = Str(allowed=_ALLOWED, allow_none=True)
     assert schema(None) is None
 
 
 def test_blank_check_precedes_allowed():
-    schema = Str(allowed=["foo", "bar"], allow_blank=True)
+    schema = Str(allowed=_ALLOWED, allow_blank=True)
     assert schema("") == ""
 
 
 def test_rejects_not_allowed_value():
-    allowed = ["foo", "bar"]
+    schema = Str(allowed=_ALLOWED)
+
+    with assert_errors([Error("not_allowed", {"allowed": _ALLOWED})]):
+        schema("baz")
+
+
+def test_accepts_unhashable_allowed_values():
+    allowed = ["foo", ["bar"]]
     schema = Str(allowed=allowed)
+    assert schema("foo") == "foo"
 
     with assert_errors([Error("not_allowed", {"allowed": allowed})]):
-        schema("baz")
+        schema("bar")
 
 
 def test_applies_rules_when_value_not_none_and_has_expected_type():
@@ -193,7 +167,7 @@ def test_ignores_rules_when_value_is_none_and_allowed():
 def test_ignores_rules_when_value_has_unexpected_type():
     schema = Str(rules=[validate_value_length_is_odd_and_add_is_ok])
 
-    with assert_errors([Error("unexpected_type", {"expected_type": type_name("str")})]):
+    with assert_errors([_UNEXPECTED_STR]):
         schema(42)
 
 